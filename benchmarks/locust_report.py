@@ -0,0 +1,94 @@
+import json
+import os
+import subprocess
+import time
+
+from locust import events
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+@events.init_command_line_parser.add_listener
+def add_arguments(parser):
+    parser.add_argument('--report-json', default='', help='Write throughput and latency percentiles to this file')
+    parser.add_argument('--baseline-json', default='', help='Compare against a report from an earlier commit')
+    parser.add_argument('--max-regression', type=float, default=0.2,
+                        help='Exit with 1 when an endpoint p95 grows by more than this fraction')
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def entry_stats(entry):
+    stats = {
+        'requests': entry.num_requests,
+        'failures': entry.num_failures,
+        'requests_per_second': round(entry.total_rps, 2),
+        'average_ms': round(entry.avg_response_time, 2),
+    }
+
+    for percentile in PERCENTILES:
+        stats[f'p{int(percentile * 100)}_ms'] = entry.get_response_time_percentile(percentile)
+
+    return stats
+
+
+def find_regressions(report, baseline, max_regression):
+    regressions = []
+
+    for name, stats in report['endpoints'].items():
+        previous = baseline['endpoints'].get(name)
+
+        if not previous or not previous['p95_ms']:
+            continue
+
+        growth = stats['p95_ms'] / previous['p95_ms'] - 1
+
+        if growth > max_regression:
+            regressions.append({
+                'endpoint': name,
+                'baseline_p95_ms': previous['p95_ms'],
+                'p95_ms': stats['p95_ms'],
+                'growth': round(growth, 3),
+            })
+
+    return regressions
+
+
+@events.quitting.add_listener
+def write_report(environment, **kwargs):
+    options = environment.parsed_options
+
+    if not options or not options.report_json:
+        return
+
+    stats = environment.stats
+
+    report = {
+        'commit': current_commit(),
+        'finished_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'users': options.num_users,
+        'duration_s': round(stats.last_request_timestamp - stats.start_time, 2) if stats.last_request_timestamp else 0,
+        'total': entry_stats(stats.total),
+        'endpoints': {
+            f'{entry.method} {entry.name}': entry_stats(entry)
+            for entry in sorted(stats.entries.values(), key=lambda entry: (entry.name, entry.method))
+        },
+    }
+
+    if options.baseline_json:
+        with open(options.baseline_json) as baseline_file:
+            report['regressions'] = find_regressions(report, json.load(baseline_file), options.max_regression)
+
+        if report['regressions']:
+            environment.process_exit_code = 1
+
+    with open(options.report_json, 'w') as report_file:
+        json.dump(report, report_file, indent=2)
@@ -0,0 +1,109 @@
+"""Moved song files to blob store
+
+Revision ID: 2791961f0fb1
+Revises: a66e4159d4b8
+Create Date: 2026-10-18 10:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from musicApp.common.blob_store import get_blob_store
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2791961f0fb1'
+down_revision: Union[str, None] = 'a66e4159d4b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 20
+
+songs = sa.table(
+    'songs',
+    sa.column('id', sa.Integer),
+    sa.column('music_file_data', sa.LargeBinary),
+    sa.column('file_hash', sa.String),
+    sa.column('file_size', sa.BigInteger),
+    sa.column('mime_type', sa.String),
+)
+
+
+def upgrade() -> None:
+    op.add_column('songs', sa.Column('file_hash', sa.String(length=64), nullable=True))
+    op.add_column('songs', sa.Column('file_size', sa.BigInteger(), nullable=True))
+    op.add_column('songs', sa.Column('mime_type', sa.String(length=100), nullable=True))
+
+    connection = op.get_bind()
+    store = get_blob_store()
+
+    update_song = (
+        songs.update()
+        .where(songs.c.id == sa.bindparam('song_id'))
+        .values(file_hash=sa.bindparam('digest'), file_size=sa.bindparam('size'), mime_type='audio/mpeg')
+    )
+
+    last_id = 0
+
+    while True:
+        rows = connection.execute(
+            sa.select(songs.c.id, songs.c.music_file_data)
+            .where(songs.c.id > last_id, songs.c.music_file_data.isnot(None))
+            .order_by(songs.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+
+        if not rows:
+            break
+
+        moved = []
+
+        for song_id, data in rows:
+            digest, size = store.save([bytes(data)])
+            moved.append({'song_id': song_id, 'digest': digest, 'size': size})
+
+        connection.execute(update_song, moved)
+        last_id = rows[-1].id
+
+    op.drop_column('songs', 'music_file_data')
+
+
+def downgrade() -> None:
+    op.add_column('songs', sa.Column('music_file_data', sa.LargeBinary(), nullable=True))
+
+    connection = op.get_bind()
+    store = get_blob_store()
+
+    restore_song = (
+        songs.update()
+        .where(songs.c.id == sa.bindparam('song_id'))
+        .values(music_file_data=sa.bindparam('data'))
+    )
+
+    last_id = 0
+
+    while True:
+        rows = connection.execute(
+            sa.select(songs.c.id, songs.c.file_hash)
+            .where(songs.c.id > last_id, songs.c.file_hash.isnot(None))
+            .order_by(songs.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+
+        if not rows:
+            break
+
+        restored = []
+
+        for song_id, digest in rows:
+            with store.open(digest) as music_file:
+                restored.append({'song_id': song_id, 'data': music_file.read()})
+
+        connection.execute(restore_song, restored)
+        last_id = rows[-1].id
+
+    op.drop_column('songs', 'mime_type')
+    op.drop_column('songs', 'file_size')
+    op.drop_column('songs', 'file_hash')
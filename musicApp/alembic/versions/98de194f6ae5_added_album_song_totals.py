@@ -0,0 +1,75 @@
+"""Added album song totals
+
+Revision ID: 98de194f6ae5
+Revises: a346dc342573
+Create Date: 2026-10-18 17:22:45.918340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '98de194f6ae5'
+down_revision: Union[str, None] = 'a346dc342573'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+albums = sa.table(
+    'albums',
+    sa.column('id', sa.Integer),
+    sa.column('song_count', sa.Integer),
+    sa.column('total_bytes', sa.BigInteger),
+)
+
+songs = sa.table(
+    'songs',
+    sa.column('album_id', sa.Integer),
+    sa.column('file_size', sa.BigInteger),
+)
+
+
+def upgrade() -> None:
+    op.add_column('albums', sa.Column('song_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('albums', sa.Column('total_bytes', sa.BigInteger(), server_default='0', nullable=False))
+
+    connection = op.get_bind()
+    last_id = 0
+
+    while True:
+        album_ids = connection.execute(
+            sa.select(albums.c.id)
+            .where(albums.c.id > last_id)
+            .order_by(albums.c.id)
+            .limit(BATCH_SIZE)
+        ).scalars().all()
+
+        if not album_ids:
+            break
+
+        totals = (
+            sa.select(
+                songs.c.album_id,
+                sa.func.count().label('song_count'),
+                sa.func.coalesce(sa.func.sum(songs.c.file_size), 0).label('total_bytes'),
+            )
+            .where(songs.c.album_id.between(album_ids[0], album_ids[-1]))
+            .group_by(songs.c.album_id)
+            .subquery()
+        )
+
+        connection.execute(
+            albums.update()
+            .where(albums.c.id == totals.c.album_id)
+            .values(song_count=totals.c.song_count, total_bytes=totals.c.total_bytes)
+        )
+        last_id = album_ids[-1]
+
+
+def downgrade() -> None:
+    op.drop_column('albums', 'total_bytes')
+    op.drop_column('albums', 'song_count')
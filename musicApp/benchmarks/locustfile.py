@@ -0,0 +1,111 @@
+# Load test scenarios for musicApp, run against a seeded PostgreSQL database.
+#
+#   python manage.py seed_catalog --albums 200 --songs-per-album 10
+#   gunicorn musicApp.wsgi --threads 8 --bind 127.0.0.1:8000
+#   locust -f benchmarks/locustfile.py --host http://127.0.0.1:8000 --headless \
+#       --users 50 --spawn-rate 10 --run-time 2m --report-json benchmarks/report.json \
+#       --baseline-json benchmarks/baseline.json
+
+import json
+import random
+import re
+import sys
+from pathlib import Path
+
+from locust import HttpUser, task, between, events
+
+# The JSON report is shared with the fruitipediaApp load tests
+sys.path.append(str(Path(__file__).resolve().parents[2] / 'benchmarks'))
+
+import locust_report  # noqa: F401 registers the JSON report options
+
+CSRF_TOKEN_PATTERN = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+manifest = {}
+
+
+@events.init_command_line_parser.add_listener
+def add_arguments(parser):
+    parser.add_argument('--seed-manifest', default='benchmarks/seed-manifest.json')
+
+
+@events.test_start.add_listener
+def load_manifest(environment, **kwargs):
+    with open(environment.parsed_options.seed_manifest) as manifest_file:
+        manifest.update(json.load(manifest_file))
+
+
+class MusicAppUser(HttpUser):
+    wait_time = between(0.5, 2)
+
+    def random_song(self):
+        return random.choice(manifest['songs'])
+
+    @task(4)
+    def browse_catalog(self):
+        self.client.get('/', name='/')
+
+        after = random.choice(manifest['albums'])
+        self.client.get(f'/?after={after}', name='/?after=[id]')
+
+    @task(3)
+    def album_details(self):
+        self.client.get(f"/album/details/{random.choice(manifest['albums'])}/", name='/album/details/[pk]/')
+
+    @task(2)
+    def play_song(self):
+        self.client.get(f"/song/play-song/{self.random_song()['id']}", name='/song/play-song/[pk]')
+
+    @task(3)
+    def stream_song(self):
+        song = self.random_song()
+        url = f"/song/serve-song/{song['id']}/{song['file_hash']}"
+
+        self.client.get(url, name='/song/serve-song/[pk]/[digest]')
+
+        start = random.randrange(song['file_size'])
+        self.client.get(
+            url,
+            headers={'Range': f'bytes={start}-'},
+            name='/song/serve-song/[pk]/[digest] range',
+        )
+
+    @task(2)
+    def replay_song(self):
+        song = self.random_song()
+
+        with self.client.get(
+            f"/song/serve-song/{song['id']}/{song['file_hash']}",
+            headers={'If-None-Match': f'"{song["file_hash"]}"'},
+            name='/song/serve-song/[pk]/[digest] revalidate',
+            catch_response=True,
+        ) as response:
+            if response.status_code == 304:
+                response.success()
+            else:
+                response.failure(f"Expected 304, got {response.status_code}")
+
+    @task(1)
+    def upload_song(self):
+        page = self.client.get('/song/create/', name='/song/create/')
+        match = CSRF_TOKEN_PATTERN.search(page.text)
+
+        if not match:
+            return
+
+        with self.client.post(
+            '/song/create/',
+            data={
+                'csrfmiddlewaretoken': match.group(1),
+                'song_name': f'Upload {random.randrange(10 ** 6)}',
+                'album': random.choice(manifest['albums']),
+            },
+            files={'music_file_data': ('upload.mp3', random.randbytes(64 * 1024), 'audio/mpeg')},
+            allow_redirects=False,
+            name='/song/create/ upload',
+            catch_response=True,
+        ) as response:
+            if response.status_code == 302:
+                response.success()
+            else:
+                response.failure(f"Upload rejected with {response.status_code}")
@@ -0,0 +1,61 @@
+# Compares the WSGI and ASGI deployments of musicApp against the same PostgreSQL database.
+#
+#   gunicorn musicApp.wsgi --threads 8 --bind 127.0.0.1:8000
+#   uvicorn musicApp.asgi:application --port 8001
+#   python benchmarks/wsgi_vs_asgi.py --path / --path /album/details/1/ --path /song/serve-song/1
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import urlopen
+
+
+def timed_get(url):
+    started = time.perf_counter()
+
+    with urlopen(url) as response:
+        while response.read(64 * 1024):
+            pass
+
+    return time.perf_counter() - started
+
+
+def run(base_url, paths, total_requests, concurrency):
+    urls = [f"{base_url}{paths[i % len(paths)]}" for i in range(total_requests)]
+
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = sorted(executor.map(timed_get, urls))
+
+    elapsed = time.perf_counter() - started
+
+    return {
+        'requests_per_second': total_requests / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--wsgi-url', default='http://127.0.0.1:8000')
+    parser.add_argument('--asgi-url', default='http://127.0.0.1:8001')
+    parser.add_argument('--path', action='append', dest='paths')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=50)
+    args = parser.parse_args()
+
+    paths = args.paths or ['/']
+
+    for name, base_url in (('WSGI', args.wsgi_url), ('ASGI', args.asgi_url)):
+        timed_get(f"{base_url}{paths[0]}")
+        result = run(base_url, paths, args.requests, args.concurrency)
+
+        print(f"{name}: {result['requests_per_second']:.1f} req/s, "
+              f"p50 {result['p50_ms']:.1f} ms, p99 {result['p99_ms']:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
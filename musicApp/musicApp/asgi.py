@@ -12,5 +12,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'musicApp.settings')
+os.environ.setdefault('MUSIC_APP_URLCONF', 'musicApp.async_urls')
 
 application = get_asgi_application()
@@ -0,0 +1,58 @@
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from django.utils.module_loading import import_string
+
+from musicApp.settings import SONG_BLOB_STORE
+
+
+class LocalBlobStore:
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path(self, digest):
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def exists(self, digest):
+        return self.path(digest).exists()
+
+    def open(self, digest):
+        return open(self.path(digest), 'rb')
+
+    def save(self, chunks):
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        sha256 = hashlib.sha256()
+        size = 0
+
+        with tempfile.NamedTemporaryFile(dir=self.root, delete=False) as tmp:
+            try:
+                for chunk in chunks:
+                    sha256.update(chunk)
+                    tmp.write(chunk)
+                    size += len(chunk)
+
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+
+        digest = sha256.hexdigest()
+        target = self.path(digest)
+
+        if target.exists():
+            os.unlink(tmp.name)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp.name, target)
+
+        return digest, size
+
+
+@lru_cache
+def get_blob_store():
+    backend = import_string(SONG_BLOB_STORE['BACKEND'])
+    return backend(**SONG_BLOB_STORE.get('OPTIONS', {}))
@@ -0,0 +1,19 @@
+from debug_toolbar.panels import Panel
+
+from musicApp.settings import query_instrumentation
+
+
+class SQLAlchemyPanel(Panel):
+    title = 'SQLAlchemy'
+    template = 'debug/sqlalchemy-panel.html'
+
+    @property
+    def nav_subtitle(self):
+        stats = self.get_stats()
+        return f"{stats.get('count', 0)} queries in {stats.get('total_ms', 0):.1f} ms"
+
+    def generate_stats(self, request, response):
+        query_log = getattr(request, 'query_log', None)
+
+        if query_log is not None:
+            self.record_stats(query_log.as_dict(query_instrumentation.n_plus_one_threshold))
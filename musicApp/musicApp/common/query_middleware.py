@@ -0,0 +1,42 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+
+from musicApp.settings import query_instrumentation
+
+
+class QueryInstrumentationMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with query_instrumentation.capture(f"{request.method} {request.path}") as query_log:
+            request.query_log = query_log
+            response = self.get_response(request)
+
+        self.export(query_log)
+        return response
+
+    async def __acall__(self, request):
+        with query_instrumentation.capture(f"{request.method} {request.path}") as query_log:
+            request.query_log = query_log
+            response = await self.get_response(request)
+
+        await sync_to_async(self.export)(query_log)
+        return response
+
+    @staticmethod
+    def export(query_log):
+        if not settings.QUERY_LOG_PATH or not query_log.count:
+            return
+
+        with open(settings.QUERY_LOG_PATH, 'a') as log_file:
+            log_file.write(query_log.to_json(query_instrumentation.n_plus_one_threshold) + '\n')
@@ -0,0 +1,62 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+from musicApp.settings import session, request_scope
+
+
+class ScopedSessionMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = request_scope.set(object())
+
+        try:
+            response = self.get_response(request)
+            self.close_session(response)
+        finally:
+            request_scope.reset(token)
+
+        return response
+
+    async def __acall__(self, request):
+        # sync_to_async copies the context, so the view and close_session see this request's token
+        token = request_scope.set(object())
+
+        try:
+            response = await self.get_response(request)
+            await sync_to_async(self.close_session)(response)
+        finally:
+            request_scope.reset(token)
+
+        return response
+
+    def close_session(self, response):
+        # Async views use AsyncSession, so there may be nothing to close
+        if not session.registry.has():
+            return
+
+        try:
+            if response.status_code < 500:
+                session.commit()
+            else:
+                session.rollback()
+
+        except Exception as e:
+            session.rollback()
+            raise e
+
+        finally:
+            session.remove()
+
+    def process_exception(self, request, exception):
+        if session.registry.has():
+            session.rollback()
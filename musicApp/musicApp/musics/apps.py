@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class MusicsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'musicApp.musics'
+
+    def ready(self):
+        import musicApp.musics.events
@@ -0,0 +1,20 @@
+from django.urls import path, include
+
+from musicApp.musics import views, async_views
+
+urlpatterns = [
+    path('',   async_views.index, name='index'),
+    path('album/', include([
+        path('create/', views.create_album, name='create album'),
+        path('details/<int:pk>/', async_views.album_details, name='details album'),
+        path('edit/<int:pk>/', views.edit_album, name='edit album'),
+        path('delete/<int:pk>/', views.delete_album, name='delete album'),
+    ])),
+    path('song/', include([
+        path('create/', views.create_song, name='create song'),
+        path('play-song/<int:pk>', async_views.play_song, name='play song'),
+        path('serve-song/<int:pk>', async_views.serve_song, name='serve song'),
+        path('serve-song/<int:pk>/<slug:digest>', async_views.serve_song_file, name='serve song file'),
+        path('peaks/<int:pk>', views.song_peaks, name='song peaks'),
+    ]))
+]
@@ -0,0 +1,165 @@
+import asyncio
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload, joinedload
+
+from musicApp.common.blob_store import get_blob_store
+from musicApp.musics.cache import (
+    aget_catalog_version, aget_album_version, catalog_page_key, album_page_key, arender_cached_page,
+)
+from musicApp.musics.models import Album, Song, SongVariant
+from musicApp.musics.streaming import requested_range, aiter_file_range, audio_type, RangeNotSatisfiable
+from musicApp.musics.views import ALBUMS_PER_PAGE, SONG_FILE_CACHE_CONTROL, get_page_start, get_requested_bitrate
+from musicApp.settings import AsyncSession
+
+
+async def index(request):
+    after = get_page_start(request)
+
+    async with AsyncSession() as async_session:
+        album_count, last_modified = await aget_catalog_version(async_session)
+
+        async def render_page():
+            albums = (await async_session.scalars(
+                select(Album)
+                .where(Album.id > after)
+                .order_by(Album.id)
+                .limit(ALBUMS_PER_PAGE + 1)
+            )).all()
+
+            next_after = albums[ALBUMS_PER_PAGE - 1].id if len(albums) > ALBUMS_PER_PAGE else None
+
+            context = {
+                'albums': albums[:ALBUMS_PER_PAGE],
+                'next_after': next_after,
+            }
+
+            return render_to_string('common/index.html', context, request)
+
+        page_key = catalog_page_key(after, album_count, last_modified)
+        return await arender_cached_page(request, page_key, last_modified, render_page)
+
+
+async def album_details(request, pk: int):
+    async with AsyncSession() as async_session:
+        last_modified = await aget_album_version(async_session, pk)
+
+        if last_modified is None:
+            return HttpResponse('Album not found', status=404)
+
+        async def render_page():
+            album = await async_session.scalar(
+                select(Album)
+                .options(selectinload(Album.songs).load_only(Song.id, Song.song_name))
+                .where(Album.id == pk)
+            )
+
+            context = {
+                'album': album,
+            }
+
+            return render_to_string('albums/album-details.html', context, request)
+
+        page_key = album_page_key(pk, last_modified)
+        return await arender_cached_page(request, page_key, last_modified, render_page)
+
+
+async def play_song(request, pk):
+    async with AsyncSession() as async_session:
+        song = await async_session.scalar(
+            select(Song)
+            .options(joinedload(Song.album).load_only(Album.image_url))
+            .where(Song.id == pk)
+        )
+
+    context = {
+        "song": song,
+    }
+
+    return render(request, 'songs/music-player.html', context)
+
+
+async def song_file_response(request, served, filename):
+    size = served.file_size
+    etag = quote_etag(served.file_hash)
+
+    response = get_conditional_response(request, etag=etag)
+
+    if response is not None:
+        response['ETag'] = etag
+        return response
+
+    try:
+        byte_range = requested_range(request, size, etag)
+    except RangeNotSatisfiable as e:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = str(e)
+        return response
+
+    start, end = byte_range or (0, size - 1)
+    music_file = await asyncio.to_thread(get_blob_store().open, served.file_hash)
+
+    response = StreamingHttpResponse(
+        aiter_file_range(music_file, start, end),
+        status=206 if byte_range else 200,
+        content_type=audio_type(served.mime_type),
+    )
+
+    if byte_range:
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+
+    response['Content-Length'] = str(end - start + 1)
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Content-Disposition'] = f'inline; filename="{filename}"'
+    return response
+
+
+async def serve_song(request, pk):
+    bitrate = get_requested_bitrate(request)
+
+    async with AsyncSession() as async_session:
+        song = await async_session.get(Song, pk)
+        variant = None
+
+        if song and bitrate:
+            variant = await async_session.scalar(
+                select(SongVariant)
+                .where(SongVariant.song_id == pk, SongVariant.bitrate == bitrate)
+            )
+
+    if not song or not song.file_hash:
+        return HttpResponse('Song not found', status=404)
+
+    response = await song_file_response(request, variant or song, song.song_name)
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
+async def serve_song_file(request, pk, digest):
+    response = get_conditional_response(request, etag=quote_etag(digest))
+
+    if response is None:
+        async with AsyncSession() as async_session:
+            song = await async_session.get(Song, pk)
+            served = song
+
+            if song and song.file_hash and song.file_hash != digest:
+                served = await async_session.scalar(
+                    select(SongVariant)
+                    .where(SongVariant.song_id == pk, SongVariant.file_hash == digest)
+                )
+
+        if not song or not song.file_hash or not served:
+            return HttpResponse('Song not found', status=404)
+
+        response = await song_file_response(request, served, song.song_name)
+
+    response['ETag'] = quote_etag(digest)
+    response['Cache-Control'] = SONG_FILE_CACHE_CONTROL
+    return response
@@ -0,0 +1,114 @@
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from sqlalchemy import select, func
+
+from musicApp.musics.models import Album
+from musicApp.settings import session
+
+ALBUM_CHOICES_CACHE_KEY = 'musics:album-choices'
+
+# Bounds how long a process without a shared cache can miss another process's album writes
+ALBUM_CHOICES_TIMEOUT = 60 * 5
+
+PAGE_CACHE_TIMEOUT = 60 * 10
+
+
+def get_album_choices():
+    choices = cache.get(ALBUM_CHOICES_CACHE_KEY)
+
+    if choices is None:
+        albums = session.query(Album.id, Album.album_name).order_by(Album.album_name).all()
+        choices = [(album.id, album.album_name) for album in albums]
+        cache.set(ALBUM_CHOICES_CACHE_KEY, choices, ALBUM_CHOICES_TIMEOUT)
+
+    return choices
+
+
+def invalidate_album_choices():
+    cache.delete(ALBUM_CHOICES_CACHE_KEY)
+
+
+def catalog_version_query():
+    return select(func.count(Album.id), func.max(Album.updated_at))
+
+
+def album_version_query(pk):
+    return select(Album.updated_at).where(Album.id == pk)
+
+
+def get_catalog_version():
+    return session.execute(catalog_version_query()).one()
+
+
+def get_album_version(pk):
+    return session.scalar(album_version_query(pk))
+
+
+async def aget_catalog_version(async_session):
+    return (await async_session.execute(catalog_version_query())).one()
+
+
+async def aget_album_version(async_session, pk):
+    return await async_session.scalar(album_version_query(pk))
+
+
+def catalog_page_key(after, album_count, last_modified):
+    version = last_modified.timestamp() if last_modified else 0
+    return f"musics:catalog-page:{after}:{album_count}:{version}"
+
+
+def album_page_key(pk, last_modified):
+    return f"musics:album-page:{pk}:{last_modified.timestamp()}"
+
+
+def invalidate_album_page(album):
+    cache.delete(album_page_key(album.id, album.updated_at))
+
+
+def conditional_page_response(request, page_key, last_modified):
+    etag = quote_etag(page_key)
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+
+    return etag, timestamp, get_conditional_response(request, etag=etag, last_modified=timestamp)
+
+
+def set_page_validators(response, etag, timestamp):
+    response['ETag'] = etag
+
+    if timestamp is not None:
+        response['Last-Modified'] = http_date(timestamp)
+
+    return response
+
+
+def render_cached_page(request, page_key, last_modified, render_page):
+    etag, timestamp, response = conditional_page_response(request, page_key, last_modified)
+
+    if response is None:
+        content = cache.get(page_key)
+
+        if content is None:
+            content = render_page()
+            cache.set(page_key, content, PAGE_CACHE_TIMEOUT)
+
+        response = HttpResponse(content)
+
+    return set_page_validators(response, etag, timestamp)
+
+
+async def arender_cached_page(request, page_key, last_modified, render_page):
+    # Same keys as render_cached_page, so the WSGI and ASGI servers share page entries
+    etag, timestamp, response = conditional_page_response(request, page_key, last_modified)
+
+    if response is None:
+        content = await cache.aget(page_key)
+
+        if content is None:
+            content = await render_page()
+            await cache.aset(page_key, content, PAGE_CACHE_TIMEOUT)
+
+        response = HttpResponse(content)
+
+    return set_page_validators(response, etag, timestamp)
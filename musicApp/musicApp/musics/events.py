@@ -0,0 +1,69 @@
+from sqlalchemy import event, select, update, func
+from sqlalchemy.orm import object_session
+from sqlalchemy.orm.attributes import get_history
+
+from musicApp.musics.cache import invalidate_album_choices
+from musicApp.musics.models import Album, Song
+from musicApp.settings import Session
+
+ALBUMS_CHANGED = 'albums_changed'
+
+
+@event.listens_for(Album, 'after_insert')
+@event.listens_for(Album, 'after_update')
+@event.listens_for(Album, 'after_delete')
+def album_changed(mapper, connection, target):
+    invalidate_album_choices()
+    object_session(target).info[ALBUMS_CHANGED] = True
+
+
+def change_album_totals(connection, album_id, songs, size):
+    # Increments instead of recounting, so concurrent flushes cannot lose each other's songs.
+    # Songs are listed on the album page, so they move its version too
+    connection.execute(
+        update(Album)
+        .where(Album.id == album_id)
+        .values(
+            song_count=Album.song_count + songs,
+            total_bytes=Album.total_bytes + size,
+            updated_at=func.now(),
+        )
+    )
+
+
+@event.listens_for(Song, 'after_insert')
+def song_added(mapper, connection, target):
+    change_album_totals(connection, target.album_id, 1, target.file_size or 0)
+
+
+@event.listens_for(Song, 'after_delete')
+def song_removed(mapper, connection, target):
+    change_album_totals(connection, target.album_id, -1, -(target.file_size or 0))
+
+
+@event.listens_for(Song, 'before_update')
+def song_changed(mapper, connection, target):
+    if not get_history(target, 'album_id').has_changes() and not get_history(target, 'file_size').has_changes():
+        return
+
+    # The old values may have been expired before the change, the row still has them
+    old_album_id, old_size = connection.execute(
+        select(Song.album_id, Song.file_size)
+        .where(Song.id == target.id)
+    ).one()
+
+    change_album_totals(connection, old_album_id, -1, -(old_size or 0))
+    change_album_totals(connection, target.album_id, 1, target.file_size or 0)
+
+
+@event.listens_for(Session, 'after_commit')
+def albums_committed(session):
+    # Drop the choices again so a request that refilled the cache
+    # between flush and commit cannot keep a stale list around
+    if session.info.pop(ALBUMS_CHANGED, False):
+        invalidate_album_choices()
+
+
+@event.listens_for(Session, 'after_rollback')
+def albums_rolled_back(session):
+    session.info.pop(ALBUMS_CHANGED, None)
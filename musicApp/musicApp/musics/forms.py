@@ -1,7 +1,9 @@
 from django import forms
 
-from musicApp.common.session_decorator import session_decorator
+from musicApp.common.blob_store import get_blob_store
+from musicApp.musics.cache import get_album_choices, invalidate_album_page
 from musicApp.musics.models import Album, Song
+from musicApp.musics.streaming import audio_type
 from musicApp.settings import session
 
 
@@ -25,7 +27,6 @@ class AlbumBaseForm(forms.Form):
 
 
 class AlbumCreateForm(AlbumBaseForm):
-    @session_decorator(session)
     def save(self):
         new_album = Album(
             album_name=self.cleaned_data['album_name'],
@@ -38,6 +39,8 @@ class AlbumCreateForm(AlbumBaseForm):
 
 class AlbumEditForm(AlbumBaseForm):
     def save(self, album):
+        invalidate_album_page(album)
+
         album.album_name = self.cleaned_data['album_name']
         album.image_url = self.cleaned_data['image_url']
         album.price = self.cleaned_data['price']
@@ -68,22 +71,24 @@ class SongBaseForm(forms.Form):
         required=True,
     )
 
-    @session_decorator(session)
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        albums = session.query(Album).all()
-        self.fields['album'].choices = [(album.id, album.album_name) for album in albums]
+        self.fields['album'].choices = get_album_choices()
 
 
 class SongCreateForm(SongBaseForm):
 
-    @session_decorator(session)
     def save(self, request):
+        music_file = request.FILES['music_file_data']
+        file_hash, file_size = get_blob_store().save(music_file.chunks())
+
         new_song = Song(
             song_name=self.cleaned_data['song_name'],
             album_id=self.cleaned_data['album'],
-            music_file_data=request.FILES['music_file_data'].read(),
+            file_hash=file_hash,
+            file_size=file_size,
+            mime_type=audio_type(music_file.content_type, music_file.name),
         )
 
         session.add(new_song)
@@ -0,0 +1,61 @@
+import json
+import random
+import tempfile
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from sqlalchemy import select, func
+
+from musicApp.musics.models import Album, Song
+from musicApp.settings import Session
+
+
+class Command(BaseCommand):
+    help = ('Fills an empty database with a reproducible catalog of synthetic albums and songs '
+            'and writes a manifest of their ids for the load tests.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--albums', type=int, default=200)
+        parser.add_argument('--songs-per-album', type=int, default=10)
+        parser.add_argument('--song-bytes', type=int, default=512 * 1024)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--manifest', default='benchmarks/seed-manifest.json')
+
+    def handle(self, *args, **options):
+        with Session() as session:
+            if session.scalar(select(func.count(Album.id))):
+                raise CommandError("The catalog is not empty, seed a fresh database so runs stay comparable")
+
+        generator = random.Random(options['seed'])
+
+        with tempfile.TemporaryDirectory() as root:
+            for album_number in range(options['albums']):
+                album_dir = Path(root) / f'Load Album {album_number:05d}'
+                album_dir.mkdir()
+
+                for song_number in range(options['songs_per_album']):
+                    song_file = album_dir / f'Track {song_number:03d}.mp3'
+                    song_file.write_bytes(generator.randbytes(options['song_bytes']))
+
+            call_command('import_music', root, price=9.99, stdout=self.stdout)
+
+        with Session() as session:
+            album_ids = session.scalars(select(Album.id).order_by(Album.id)).all()
+            songs = session.execute(
+                select(Song.id, Song.album_id, Song.file_hash, Song.file_size)
+                .order_by(Song.id)
+            ).all()
+
+        manifest = {
+            'seed': options['seed'],
+            'albums': album_ids,
+            'songs': [song._asdict() for song in songs],
+        }
+
+        with open(options['manifest'], 'w') as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(album_ids)} albums and {len(songs)} songs, manifest written to {options['manifest']}."
+        ))
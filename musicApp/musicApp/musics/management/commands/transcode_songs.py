@@ -0,0 +1,32 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+
+from musicApp.musics.transcoding import get_pending_song_ids, init_worker, process_song
+from musicApp.settings import Session
+
+
+class Command(BaseCommand):
+    help = 'Creates the lower-bitrate variants and waveform peaks of uploaded songs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count())
+
+    def handle(self, *args, **options):
+        with Session() as session:
+            song_ids = get_pending_song_ids(session)
+
+        failed = 0
+
+        with ProcessPoolExecutor(max_workers=options['workers'], initializer=init_worker) as executor:
+            futures = {executor.submit(process_song, song_id): song_id for song_id in song_ids}
+
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"Song {futures[future]} failed: {e}")
+
+        self.stdout.write(f"Processed {len(song_ids) - failed} songs, {failed} failed.")
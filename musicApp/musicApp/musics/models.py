@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, LargeBinary
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, BigInteger, DateTime, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 
 from musicApp.settings import Base
@@ -28,6 +28,27 @@ class Album(Base):
         nullable=False,
     )
 
+    song_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default='0',
+    )
+
+    total_bytes = Column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default='0',
+    )
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
     songs = relationship(
         "Song",
         back_populates="album",
@@ -47,8 +68,20 @@ class Song(Base):
         String(30)
     )
 
-    music_file_data = Column(
-        LargeBinary,
+    file_hash = Column(
+        String(64),
+    )
+
+    file_size = Column(
+        BigInteger,
+    )
+
+    mime_type = Column(
+        String(100),
+    )
+
+    peaks_hash = Column(
+        String(64),
     )
 
     album_id = Column(
@@ -61,3 +94,53 @@ class Song(Base):
         "Album",
         back_populates="songs",
     )
+
+    variants = relationship(
+        "SongVariant",
+        back_populates="song",
+        cascade="all, delete-orphan"
+    )
+
+
+class SongVariant(Base):
+    __tablename__ = 'song_variants'
+
+    __table_args__ = (
+        UniqueConstraint('song_id', 'bitrate'),
+    )
+
+    id = Column(
+        Integer,
+        primary_key=True,
+    )
+
+    song_id = Column(
+        Integer,
+        ForeignKey("songs.id"),
+        nullable=False,
+    )
+
+    bitrate = Column(
+        Integer,
+        nullable=False,
+    )
+
+    file_hash = Column(
+        String(64),
+        nullable=False,
+    )
+
+    file_size = Column(
+        BigInteger,
+        nullable=False,
+    )
+
+    mime_type = Column(
+        String(100),
+        nullable=False,
+    )
+
+    song = relationship(
+        "Song",
+        back_populates="variants",
+    )
@@ -0,0 +1,90 @@
+import asyncio
+import mimetypes
+import re
+
+CHUNK_SIZE = 64 * 1024
+
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+AUDIO_TYPE_PATTERN = re.compile(r'^audio/[\w.+-]+$')
+
+DEFAULT_AUDIO_TYPE = 'audio/mpeg'
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header, size):
+    match = RANGE_PATTERN.match(header.strip())
+
+    if not match or match.groups() == ('', ''):
+        return None
+
+    first, last = match.groups()
+
+    if first == '':
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+
+    if start >= size or start > end:
+        raise RangeNotSatisfiable(f"bytes */{size}")
+
+    return start, end
+
+
+def audio_type(content_type=None, filename=None):
+    # Upload types come from the client and are sent back as the response type,
+    # so anything that is not audio falls back to the extension and then to MP3
+    guessed = mimetypes.guess_type(filename)[0] if filename else None
+
+    for candidate in (content_type, guessed):
+        if candidate and AUDIO_TYPE_PATTERN.match(candidate.lower()):
+            return candidate.lower()
+
+    return DEFAULT_AUDIO_TYPE
+
+
+def requested_range(request, size, etag):
+    range_header = request.headers.get('Range')
+    if_range = request.headers.get('If-Range')
+
+    if not range_header or (if_range is not None and if_range != etag):
+        return None
+
+    return parse_range(range_header, size)
+
+
+def iter_file_range(file, start, end, chunk_size=CHUNK_SIZE):
+    with file:
+        file.seek(start)
+        remaining = end - start + 1
+
+        while remaining > 0:
+            chunk = file.read(min(chunk_size, remaining))
+
+            if not chunk:
+                break
+
+            remaining -= len(chunk)
+            yield chunk
+
+
+async def aiter_file_range(file, start, end, chunk_size=CHUNK_SIZE):
+    try:
+        await asyncio.to_thread(file.seek, start)
+        remaining = end - start + 1
+
+        while remaining > 0:
+            chunk = await asyncio.to_thread(file.read, min(chunk_size, remaining))
+
+            if not chunk:
+                break
+
+            remaining -= len(chunk)
+            yield chunk
+
+    finally:
+        await asyncio.to_thread(file.close)
@@ -0,0 +1,134 @@
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from array import array
+
+from sqlalchemy import select, func, or_
+
+from musicApp.common.blob_store import get_blob_store
+from musicApp.musics.models import Song, SongVariant
+from musicApp.settings import Session, engine
+
+VARIANT_BITRATES = (64, 128)
+
+CHUNK_SIZE = 64 * 1024
+
+PEAKS_SAMPLE_RATE = 8000
+SAMPLES_PER_PEAK = 800
+PEAK_BYTES = SAMPLES_PER_PEAK * 2
+
+
+def init_worker():
+    # Connections inherited from the parent process must not be reused
+    engine.dispose(close=False)
+
+
+def ffmpeg_output(args):
+    process = subprocess.Popen(
+        ['ffmpeg', '-nostdin', '-loglevel', 'error', *args],
+        stdout=subprocess.PIPE,
+    )
+
+    with process:
+        yield from iter(lambda: process.stdout.read(CHUNK_SIZE), b'')
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, 'ffmpeg')
+
+
+def transcode(source_path, bitrate):
+    return get_blob_store().save(ffmpeg_output([
+        '-i', source_path, '-vn', '-codec:a', 'libmp3lame', '-b:a', f'{bitrate}k', '-f', 'mp3', 'pipe:1',
+    ]))
+
+
+def compute_peaks(source_path):
+    peaks = []
+    buffer = b''
+
+    def add_peaks(data):
+        samples = array('h', data)
+
+        if sys.byteorder == 'big':
+            samples.byteswap()
+
+        for offset in range(0, len(samples), SAMPLES_PER_PEAK):
+            bucket = samples[offset:offset + SAMPLES_PER_PEAK]
+            peaks.append(max(max(bucket), -min(bucket)))
+
+    for chunk in ffmpeg_output([
+        '-i', source_path, '-vn', '-ac', '1', '-ar', str(PEAKS_SAMPLE_RATE), '-f', 's16le', 'pipe:1',
+    ]):
+        buffer += chunk
+        usable = len(buffer) - len(buffer) % PEAK_BYTES
+        add_peaks(buffer[:usable])
+        buffer = buffer[usable:]
+
+    if len(buffer) > 1:
+        add_peaks(buffer[:len(buffer) - len(buffer) % 2])
+
+    loudest = max(peaks, default=0) or 1
+
+    return {
+        'peaks_per_second': PEAKS_SAMPLE_RATE / SAMPLES_PER_PEAK,
+        'peaks': [round(peak / loudest, 3) for peak in peaks],
+    }
+
+
+def get_pending_song_ids(session):
+    variant_count = (
+        select(func.count(SongVariant.id))
+        .where(SongVariant.song_id == Song.id)
+        .scalar_subquery()
+    )
+
+    return session.scalars(
+        select(Song.id)
+        .where(
+            Song.file_hash.isnot(None),
+            or_(Song.peaks_hash.is_(None), variant_count < len(VARIANT_BITRATES)),
+        )
+        .order_by(Song.id)
+    ).all()
+
+
+def process_song(song_id):
+    store = get_blob_store()
+
+    with Session() as session:
+        song = session.get(Song, song_id)
+
+        if not song or not song.file_hash:
+            return
+
+        done = {variant.bitrate for variant in song.variants}
+
+        with tempfile.NamedTemporaryFile() as source:
+            with store.open(song.file_hash) as music_file:
+                shutil.copyfileobj(music_file, source)
+
+            source.flush()
+
+            # Every result is committed on its own, so an interrupted run
+            # picks up from the first missing variant
+            for bitrate in VARIANT_BITRATES:
+                if bitrate in done:
+                    continue
+
+                file_hash, file_size = transcode(source.name, bitrate)
+
+                session.add(SongVariant(
+                    song_id=song.id,
+                    bitrate=bitrate,
+                    file_hash=file_hash,
+                    file_size=file_size,
+                    mime_type='audio/mpeg',
+                ))
+                session.commit()
+
+            if not song.peaks_hash:
+                peaks = compute_peaks(source.name)
+                song.peaks_hash, _ = store.save([json.dumps(peaks).encode()])
+                session.commit()
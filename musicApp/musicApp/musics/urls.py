@@ -14,5 +14,7 @@ urlpatterns = [
         path('create/', views.create_song, name='create song'),
         path('play-song/<int:pk>', views.play_song, name='play song'),
         path('serve-song/<int:pk>', views.serve_song, name='serve song'),
+        path('serve-song/<int:pk>/<slug:digest>', views.serve_song_file, name='serve song file'),
+        path('peaks/<int:pk>', views.song_peaks, name='song peaks'),
     ]))
 ]
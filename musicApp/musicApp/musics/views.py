@@ -1,21 +1,59 @@
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse, FileResponse
 from django.shortcuts import render, redirect
-
+from django.template.loader import render_to_string
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from sqlalchemy.orm import selectinload, joinedload
+
+from musicApp.musics.cache import (
+    get_catalog_version, get_album_version, catalog_page_key, album_page_key, invalidate_album_page,
+    render_cached_page,
+)
 from musicApp.musics.forms import SongCreateForm, AlbumCreateForm, AlbumEditForm, AlbumDeleteForm
-from musicApp.musics.models import Album, Song
+from musicApp.musics.models import Album, Song, SongVariant
+from musicApp.musics.streaming import requested_range, iter_file_range, audio_type, RangeNotSatisfiable
 from musicApp.settings import session
-from musicApp.common.session_decorator import session_decorator
+from musicApp.common.blob_store import get_blob_store
+
+ALBUMS_PER_PAGE = 12
+
+SONG_FILE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def get_page_start(request):
+    after = request.GET.get('after', '')
+    return int(after) if after.isdigit() else 0
+
+
+def get_requested_bitrate(request):
+    bitrate = request.GET.get('bitrate', '')
+    return int(bitrate) if bitrate.isdigit() else None
 
 
-@session_decorator(session)
 def index(request):
-    albums = session.query(Album).all()
+    after = get_page_start(request)
+    album_count, last_modified = get_catalog_version()
 
-    context = {
-        'albums': albums,
-    }
+    def render_page():
+        albums = (
+            session.query(Album)
+            .filter(Album.id > after)
+            .order_by(Album.id)
+            .limit(ALBUMS_PER_PAGE + 1)
+            .all()
+        )
+
+        next_after = albums[ALBUMS_PER_PAGE - 1].id if len(albums) > ALBUMS_PER_PAGE else None
 
-    return render(request, 'common/index.html', context)
+        context = {
+            'albums': albums[:ALBUMS_PER_PAGE],
+            'next_after': next_after,
+        }
+
+        return render_to_string('common/index.html', context, request)
+
+    page_key = catalog_page_key(after, album_count, last_modified)
+    return render_cached_page(request, page_key, last_modified, render_page)
 
 
 def create_album(request):
@@ -35,7 +73,6 @@ def create_album(request):
     return render(request, 'albums/create-album.html', context)
 
 
-@session_decorator(session)
 def edit_album(request, pk: int):
     album = session.query(Album).filter(Album.id == pk).first()
 
@@ -60,7 +97,6 @@ def edit_album(request, pk: int):
     return render(request, 'albums/edit-album.html', context)
 
 
-@session_decorator(session)
 def delete_album(request, pk: int):
     album = session.query(Album).filter(Album.id == pk).first()
 
@@ -71,6 +107,7 @@ def delete_album(request, pk: int):
             'price': album.price,
         })
     else:
+        invalidate_album_page(album)
         session.delete(album)
         return redirect('index')
 
@@ -82,15 +119,27 @@ def delete_album(request, pk: int):
     return render(request, 'albums/delete-album.html', context)
 
 
-@session_decorator(session)
 def album_details(request, pk: int):
-    album = session.query(Album).filter(Album.id == pk).first()
+    last_modified = get_album_version(pk)
 
-    context = {
-        'album': album,
-    }
+    if last_modified is None:
+        return HttpResponse('Album not found', status=404)
+
+    def render_page():
+        album = (
+            session.query(Album)
+            .options(selectinload(Album.songs).load_only(Song.id, Song.song_name))
+            .filter(Album.id == pk)
+            .first()
+        )
+
+        context = {
+            'album': album,
+        }
+
+        return render_to_string('albums/album-details.html', context, request)
 
-    return render(request, 'albums/album-details.html', context)
+    return render_cached_page(request, album_page_key(pk, last_modified), last_modified, render_page)
 
 
 def create_song(request):
@@ -110,9 +159,13 @@ def create_song(request):
     return render(request, 'songs/create-song.html', context)
 
 
-@session_decorator(session)
 def play_song(request, pk):
-    song = session.query(Song).filter(Song.id == pk).first()
+    song = (
+        session.query(Song)
+        .options(joinedload(Song.album).load_only(Album.image_url))
+        .filter(Song.id == pk)
+        .first()
+    )
 
     context = {
         "song": song,
@@ -121,13 +174,100 @@ def play_song(request, pk):
     return render(request, 'songs/music-player.html', context)
 
 
-@session_decorator(session)
-def serve_song(request, pk):
-    song = session.query(Song).filter(Song.id == pk).first()
+def song_file_response(request, served, filename):
+    size = served.file_size
+    etag = quote_etag(served.file_hash)
+
+    response = get_conditional_response(request, etag=etag)
+
+    if response is not None:
+        response['ETag'] = etag
+        return response
 
-    if song:
-        response = HttpResponse(song.music_file_data, content_type='audio/mpeg')
-        response['Content-Disposition'] = f'inline; filename="{song.song_name}"'
+    try:
+        byte_range = requested_range(request, size, etag)
+    except RangeNotSatisfiable as e:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = str(e)
         return response
+
+    music_file = get_blob_store().open(served.file_hash)
+
+    if byte_range:
+        start, end = byte_range
+
+        response = StreamingHttpResponse(
+            iter_file_range(music_file, start, end),
+            status=206,
+            content_type=audio_type(served.mime_type),
+        )
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(end - start + 1)
+        response['Content-Disposition'] = f'inline; filename="{filename}"'
     else:
+        response = FileResponse(music_file, content_type=audio_type(served.mime_type), filename=filename)
+
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    return response
+
+
+def serve_song(request, pk):
+    song = session.query(Song).filter(Song.id == pk).first()
+
+    if not song or not song.file_hash:
         return HttpResponse('Song not found', status=404)
+
+    served = song
+    bitrate = get_requested_bitrate(request)
+
+    if bitrate:
+        variant = (
+            session.query(SongVariant)
+            .filter(SongVariant.song_id == pk, SongVariant.bitrate == bitrate)
+            .first()
+        )
+        served = variant or song
+
+    # The same URL serves a new file once the song is replaced, so it is always revalidated
+    response = song_file_response(request, served, song.song_name)
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
+def serve_song_file(request, pk, digest):
+    # The digest names the exact file, so a revalidation is answered without the database
+    response = get_conditional_response(request, etag=quote_etag(digest))
+
+    if response is None:
+        song = session.query(Song).filter(Song.id == pk).first()
+
+        if not song or not song.file_hash:
+            return HttpResponse('Song not found', status=404)
+
+        served = song
+
+        if song.file_hash != digest:
+            served = (
+                session.query(SongVariant)
+                .filter(SongVariant.song_id == pk, SongVariant.file_hash == digest)
+                .first()
+            )
+
+            if not served:
+                return HttpResponse('Song not found', status=404)
+
+        response = song_file_response(request, served, song.song_name)
+
+    response['ETag'] = quote_etag(digest)
+    response['Cache-Control'] = SONG_FILE_CACHE_CONTROL
+    return response
+
+
+def song_peaks(request, pk):
+    peaks_hash = session.query(Song.peaks_hash).filter(Song.id == pk).scalar()
+
+    if not peaks_hash:
+        return HttpResponse('Peaks not found', status=404)
+
+    return FileResponse(get_blob_store().open(peaks_hash), content_type='application/json')
@@ -0,0 +1,82 @@
+import argparse
+import os
+import statistics
+import time
+import tracemalloc
+
+import django
+
+# Set up Django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
+django.setup()
+
+from django.db import connection, transaction
+
+from caller import iter_astronauts
+
+SEED_ASTRONAUTS = """
+    INSERT INTO main_app_astronaut (name, phone_number, is_active, spacewalks, updated_at)
+    SELECT
+        'Astronaut ' || substr(md5(n::text), 1, 12),
+        lpad((offset_id + n)::text, 12, '0'),
+        n %% 10 <> 0,
+        n %% 7,
+        now()
+    FROM generate_series(1, %s) AS n,
+         (SELECT coalesce(max(id), 0) AS offset_id FROM main_app_astronaut) AS existing
+"""
+
+
+def seed(count):
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(SEED_ASTRONAUTS, [count])
+        cursor.execute('ANALYZE main_app_astronaut')
+
+
+def time_search(search_string, runs, limit, use_index):
+    timings = []
+
+    for _ in range(runs):
+        with transaction.atomic():
+            if not use_index:
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_bitmapscan = off')
+                    cursor.execute('SET LOCAL enable_indexscan = off')
+
+            started = time.perf_counter()
+            found = sum(1 for _ in iter_astronauts(search_string, limit))
+            timings.append(time.perf_counter() - started)
+
+    return statistics.median(timings) * 1000, found
+
+
+def peak_memory(search_string):
+    tracemalloc.start()
+
+    with transaction.atomic():
+        for _ in iter_astronauts(search_string):
+            pass
+
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak / 1024
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seed', type=int, default=0, help='number of synthetic astronauts to insert first, e.g. 1000000')
+    parser.add_argument('--search', default='00042')
+    parser.add_argument('--limit', type=int, default=100)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    if args.seed:
+        seed(args.seed)
+
+    sequential, found = time_search(args.search, args.runs, args.limit, use_index=False)
+    indexed, _ = time_search(args.search, args.runs, args.limit, use_index=True)
+
+    print(f"sequential scan: {sequential:.1f} ms, trigram index: {indexed:.1f} ms "
+          f"(median of {args.runs}, {found} rows, limit {args.limit})")
+    print(f"streaming every match of {args.search!r} peaked at {peak_memory(args.search):.0f} KiB of Python memory")
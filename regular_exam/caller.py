@@ -1,6 +1,6 @@
 import os
 import django
-from django.db.models import Q, Count, Sum, F, Avg
+from django.db.models import Count, F, Avg
 
 # Set up Django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
@@ -9,23 +9,22 @@ django.setup()
 from main_app.models import *
 
 
-def get_astronauts(search_string=None):
-    if search_string is None:
-        return ""
+def iter_astronauts(search_string, limit=None, chunk_size=2000):
+    astronauts = Astronaut.objects.search(search_string).only('name', 'phone_number', 'is_active')
+
+    if limit is not None:
+        astronauts = astronauts[:limit]
 
-    astronauts = Astronaut.objects.filter(
-        Q(name__icontains=search_string)
-        |
-        Q(phone_number__icontains=search_string)
-    ).order_by('name')
+    # iterator() streams the rows in chunks instead of caching the whole result
+    for a in astronauts.iterator(chunk_size=chunk_size):
+        yield f"Astronaut: {a.name}, phone number: {a.phone_number}, status: {'Active' if a.is_active else 'Inactive'}"
 
-    if not astronauts:
+
+def get_astronauts(search_string=None, limit=None):
+    if search_string is None:
         return ""
 
-    return '\n'.join(
-        f"Astronaut: {a.name}, phone number: {a.phone_number}, status: {'Active' if a.is_active else 'Inactive'}"
-        for a in astronauts
-    )
+    return '\n'.join(iter_astronauts(search_string, limit))
 
 
 def get_top_astronaut():
@@ -38,21 +37,17 @@ def get_top_astronaut():
 
 
 def get_top_commander():
-    astronaut = Astronaut.objects.annotate(
-        commanded_missions=Count('missions_commander')
-    ).order_by('-commanded_missions', 'phone_number').first()
+    astronaut = Astronaut.objects.order_by('-commanded_count', 'phone_number').first()
 
-    if not astronaut or astronaut.commanded_missions == 0:
+    if not astronaut or astronaut.commanded_count == 0:
         return 'No data.'
 
-    return f"Top Commander: {astronaut.name} with {astronaut.commanded_missions} commanded missions."
+    return f"Top Commander: {astronaut.name} with {astronaut.commanded_count} commanded missions."
 
 
 def get_last_completed_mission():
     mission = Mission.objects\
-        .select_related('spacecraft')\
-        .prefetch_related('astronauts')\
-        .annotate(num_spacewalks=Sum('astronauts__spacewalks'))\
+        .with_crew_summary()\
         .filter(status='Completed')\
         .order_by('-launch_date')\
         .first()
@@ -61,9 +56,8 @@ def get_last_completed_mission():
         return 'No data.'
 
     commander = 'TBA' if not mission.commander else mission.commander.name
-    astronauts = ', '.join(a.name for a in mission.astronauts.all().order_by('name'))
 
-    return f"The last completed mission is: {mission.name}. Commander: {commander}. Astronauts: {astronauts}. "\
+    return f"The last completed mission is: {mission.name}. Commander: {commander}. Astronauts: {mission.astronaut_names}. "\
            f"Spacecraft: {mission.spacecraft.name}. Total spacewalks: {mission.num_spacewalks}."
 
 
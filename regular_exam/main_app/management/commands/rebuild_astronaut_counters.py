@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from main_app.models import Astronaut
+
+
+class Command(BaseCommand):
+    help = ('Recomputes missions_count and commanded_count for every astronaut in one statement, '
+            'repairing counters changed behind the signals, e.g. by QuerySet.update().')
+
+    def handle(self, *args, **options):
+        updated = Astronaut.objects.refresh_mission_counts()
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt mission counters for {updated} astronauts."))
@@ -1,9 +1,49 @@
+from django.apps import apps
+from django.contrib.postgres.aggregates import StringAgg
 from django.db import models
-from django.db.models import Count
+from django.db.models import Count, Q, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 
 
 class CustomAstronautManager(models.Manager):
+    def refresh_mission_counts(self, astronaut_ids=None):
+        Mission = apps.get_model('main_app', 'Mission')
+        astronauts = self.all() if astronaut_ids is None else self.filter(pk__in=astronaut_ids)
+
+        missions = Mission.astronauts.through.objects.filter(
+            astronaut_id=OuterRef('pk')
+        ).values('astronaut_id').annotate(total=Count('pk')).values('total')
+
+        commanded = Mission.objects.filter(
+            commander_id=OuterRef('pk')
+        ).values('commander_id').annotate(total=Count('pk')).values('total')
+
+        return astronauts.update(
+            missions_count=Coalesce(Subquery(missions), 0),
+            commanded_count=Coalesce(Subquery(commanded), 0),
+        )
+
+    def search(self, search_string):
+        # Phone numbers are digits only, so a case-sensitive match gives the same
+        # result and can use the plain trigram index on the column
+        return self.filter(
+            Q(name__icontains=search_string)
+            |
+            Q(phone_number__contains=search_string)
+        ).order_by('name')
+
     def get_astronauts_by_missions_count(self):
+        # Ordering by the stored counter lets LIMIT 1 walk astronaut_missions_idx
         return self.annotate(
-            num_missions=Count('missions_astronauts')
-        ).order_by('-num_missions', 'phone_number')
+            num_missions=F('missions_count')
+        ).order_by('-missions_count', 'phone_number')
+
+
+class MissionQuerySet(models.QuerySet):
+    def with_crew_summary(self):
+        # Both aggregates walk the same single astronauts join, so the whole summary
+        # comes back with the mission, spacecraft and commander in one query
+        return self.select_related('spacecraft', 'commander').annotate(
+            astronaut_names=StringAgg('astronauts__name', ', ', ordering='astronauts__name', default=''),
+            num_spacewalks=Sum('astronauts__spacewalks'),
+        )
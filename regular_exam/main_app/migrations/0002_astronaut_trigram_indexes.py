@@ -0,0 +1,28 @@
+# Generated by Django 5.0.4 on 2026-10-18 18:40
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('main_app', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='astronaut',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='astronaut_name_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='astronaut',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['phone_number'], name='astronaut_phone_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
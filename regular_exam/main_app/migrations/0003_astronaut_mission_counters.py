@@ -0,0 +1,64 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+BACKFILL_MISSIONS_COUNT = """
+    UPDATE main_app_astronaut AS astronaut
+    SET missions_count = missions.total
+    FROM (
+        SELECT astronaut_id, count(*) AS total
+        FROM main_app_mission_astronauts
+        GROUP BY astronaut_id
+    ) AS missions
+    WHERE missions.astronaut_id = astronaut.id
+"""
+
+BACKFILL_COMMANDED_COUNT = """
+    UPDATE main_app_astronaut AS astronaut
+    SET commanded_count = commanded.total
+    FROM (
+        SELECT commander_id, count(*) AS total
+        FROM main_app_mission
+        WHERE commander_id IS NOT NULL
+        GROUP BY commander_id
+    ) AS commanded
+    WHERE commanded.commander_id = astronaut.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('main_app', '0002_astronaut_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='astronaut',
+            name='commanded_count',
+            field=models.PositiveIntegerField(db_default=0, default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='astronaut',
+            name='missions_count',
+            field=models.PositiveIntegerField(db_default=0, default=0, editable=False),
+        ),
+        migrations.RunSQL(
+            sql=[BACKFILL_MISSIONS_COUNT, BACKFILL_COMMANDED_COUNT],
+            reverse_sql=migrations.RunSQL.noop,
+            elidable=True,
+        ),
+        AddIndexConcurrently(
+            model_name='astronaut',
+            index=models.Index(fields=['-missions_count', 'phone_number'], name='astronaut_missions_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='astronaut',
+            index=models.Index(fields=['-commanded_count', 'phone_number'], name='astronaut_commanded_idx'),
+        ),
+    ]
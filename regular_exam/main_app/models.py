@@ -1,7 +1,9 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import MinValueValidator, RegexValidator
 from django.db import models
+from django.db.models.functions import Upper
 
-from main_app.managers import CustomAstronautManager
+from main_app.managers import CustomAstronautManager, MissionQuerySet
 from main_app.mixins import BaseNameMixin, UpdateMixin
 
 
@@ -31,8 +33,31 @@ class Astronaut(BaseNameMixin, UpdateMixin):
         validators=[MinValueValidator(0)]
     )
 
+    # Kept current by main_app.signals, rebuilt by the rebuild_astronaut_counters command
+    missions_count = models.PositiveIntegerField(
+        default=0,
+        db_default=0,
+        editable=False,
+    )
+
+    commanded_count = models.PositiveIntegerField(
+        default=0,
+        db_default=0,
+        editable=False,
+    )
+
     objects = CustomAstronautManager()
 
+    class Meta:
+        # Trigram indexes let the substring searches in get_astronauts skip the full scan,
+        # name__icontains compares UPPER(name) so that is the indexed expression
+        indexes = [
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='astronaut_name_trgm'),
+            GinIndex(fields=['phone_number'], opclasses=['gin_trgm_ops'], name='astronaut_phone_trgm'),
+            models.Index(fields=['-missions_count', 'phone_number'], name='astronaut_missions_idx'),
+            models.Index(fields=['-commanded_count', 'phone_number'], name='astronaut_commanded_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -94,5 +119,7 @@ class Mission(BaseNameMixin, UpdateMixin):
         related_name='missions_commander'
     )
 
+    objects = MissionQuerySet.as_manager()
+
     def __str__(self):
         return self.name
@@ -0,0 +1,57 @@
+from django.db.models.signals import m2m_changed, pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+
+from main_app.models import Astronaut, Mission
+
+
+@receiver(m2m_changed, sender=Mission.astronauts.through)
+def mission_astronauts_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear' and not reverse:
+        instance._cleared_astronaut_ids = list(instance.astronauts.values_list('pk', flat=True))
+
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if reverse:
+        astronaut_ids = [instance.pk]
+    elif action == 'post_clear':
+        astronaut_ids = instance.__dict__.pop('_cleared_astronaut_ids', [])
+    else:
+        astronaut_ids = pk_set
+
+    Astronaut.objects.refresh_mission_counts(astronaut_ids)
+
+
+@receiver(pre_save, sender=Mission)
+def remember_previous_commander(sender, instance, **kwargs):
+    if instance._state.adding:
+        instance._previous_commander_id = None
+    else:
+        instance._previous_commander_id = Mission.objects.filter(
+            pk=instance.pk
+        ).values_list('commander_id', flat=True).first()
+
+
+@receiver(post_save, sender=Mission)
+def mission_saved(sender, instance, **kwargs):
+    previous_commander_id = instance.__dict__.pop('_previous_commander_id', None)
+
+    if previous_commander_id == instance.commander_id:
+        return
+
+    Astronaut.objects.refresh_mission_counts(
+        {previous_commander_id, instance.commander_id} - {None}
+    )
+
+
+@receiver(pre_delete, sender=Mission)
+def remember_mission_astronauts(sender, instance, **kwargs):
+    # The through rows are gone by post_delete and no m2m_changed is sent for them
+    instance._affected_astronaut_ids = {*instance.astronauts.values_list('pk', flat=True), instance.commander_id}
+
+
+@receiver(post_delete, sender=Mission)
+def mission_deleted(sender, instance, **kwargs):
+    Astronaut.objects.refresh_mission_counts(
+        instance.__dict__.pop('_affected_astronaut_ids', set()) - {None}
+    )
@@ -1,3 +1,192 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from caller import get_last_completed_mission
+from main_app.models import Astronaut, Mission, Spacecraft
+
+
+class LastCompletedMissionTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.spacecraft = Spacecraft.objects.create(
+            name='Endeavour',
+            manufacturer='Rockwell',
+            capacity=7,
+            weight=78000,
+            launch_date=date(1991, 4, 25),
+        )
+
+        cls.zed = Astronaut.objects.create(name='Zed', phone_number='111', spacewalks=3)
+        cls.amy = Astronaut.objects.create(name='Amy', phone_number='222', spacewalks=4)
+
+    def create_mission(self, name, status, launch_date, commander=None, crew=()):
+        mission = Mission.objects.create(
+            name=name,
+            status=status,
+            launch_date=launch_date,
+            spacecraft=self.spacecraft,
+            commander=commander,
+        )
+        mission.astronauts.add(*crew)
+
+        return mission
+
+    def test_no_completed_mission(self):
+        self.create_mission('Artemis', Mission.StatusChoices.PLANNED, date(2025, 1, 1))
+
+        self.assertEqual(get_last_completed_mission(), 'No data.')
+
+    def test_renders_in_one_query(self):
+        self.create_mission('Apollo', Mission.StatusChoices.COMPLETED, date(2019, 1, 1), crew=[self.amy])
+        self.create_mission('Artemis', Mission.StatusChoices.PLANNED, date(2025, 1, 1), crew=[self.zed])
+        self.create_mission(
+            'Gemini', Mission.StatusChoices.COMPLETED, date(2021, 1, 1), commander=self.zed, crew=[self.zed, self.amy],
+        )
+
+        with self.assertNumQueries(1):
+            result = get_last_completed_mission()
+
+        self.assertEqual(
+            result,
+            "The last completed mission is: Gemini. Commander: Zed. Astronauts: Amy, Zed. "
+            "Spacecraft: Endeavour. Total spacewalks: 7."
+        )
+
+    def test_renders_without_commander_and_crew_in_one_query(self):
+        self.create_mission('Mercury', Mission.StatusChoices.COMPLETED, date(2021, 1, 1))
+
+        with self.assertNumQueries(1):
+            result = get_last_completed_mission()
+
+        self.assertEqual(
+            result,
+            "The last completed mission is: Mercury. Commander: TBA. Astronauts: . "
+            "Spacecraft: Endeavour. Total spacewalks: None."
+        )
+
+
+class MissionCountersTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.spacecraft = Spacecraft.objects.create(
+            name='Endeavour',
+            manufacturer='Rockwell',
+            capacity=7,
+            weight=78000,
+            launch_date=date(1991, 4, 25),
+        )
+
+        cls.zed = Astronaut.objects.create(name='Zed', phone_number='111')
+        cls.amy = Astronaut.objects.create(name='Amy', phone_number='222')
+        cls.bob = Astronaut.objects.create(name='Bob', phone_number='333')
+
+    def create_mission(self, name, commander=None, spacecraft=None):
+        return Mission.objects.create(
+            name=name,
+            launch_date=date(2021, 1, 1),
+            spacecraft=spacecraft or self.spacecraft,
+            commander=commander,
+        )
+
+    def assertCounters(self, astronaut, missions, commanded):
+        astronaut.refresh_from_db()
+
+        self.assertEqual(
+            (astronaut.missions_count, astronaut.commanded_count),
+            (missions, commanded),
+            astronaut.name,
+        )
+
+    def test_add_remove_and_clear_crew(self):
+        gemini = self.create_mission('Gemini')
+        apollo = self.create_mission('Apollo')
+
+        gemini.astronauts.add(self.zed, self.amy)
+        apollo.astronauts.add(self.zed)
+
+        self.assertCounters(self.zed, 2, 0)
+        self.assertCounters(self.amy, 1, 0)
+
+        gemini.astronauts.remove(self.zed)
+
+        self.assertCounters(self.zed, 1, 0)
+
+        gemini.astronauts.clear()
+
+        self.assertCounters(self.amy, 0, 0)
+        self.assertCounters(self.zed, 1, 0)
+
+    def test_add_and_clear_from_the_astronaut_side(self):
+        gemini = self.create_mission('Gemini')
+        apollo = self.create_mission('Apollo')
+
+        self.zed.missions_astronauts.add(gemini, apollo)
+
+        self.assertCounters(self.zed, 2, 0)
+
+        self.zed.missions_astronauts.clear()
+
+        self.assertCounters(self.zed, 0, 0)
+
+    def test_commander_change(self):
+        gemini = self.create_mission('Gemini', commander=self.zed)
+
+        self.assertCounters(self.zed, 0, 1)
+
+        gemini.commander = self.amy
+        gemini.save()
+
+        self.assertCounters(self.zed, 0, 0)
+        self.assertCounters(self.amy, 0, 1)
+
+        gemini.commander = None
+        gemini.save()
+
+        self.assertCounters(self.amy, 0, 0)
+
+    def test_mission_delete(self):
+        gemini = self.create_mission('Gemini', commander=self.zed)
+        gemini.astronauts.add(self.zed, self.amy)
+
+        gemini.delete()
+
+        self.assertCounters(self.zed, 0, 0)
+        self.assertCounters(self.amy, 0, 0)
+
+    def test_spacecraft_delete_cascades_to_counters(self):
+        shuttle = Spacecraft.objects.create(
+            name='Atlantis',
+            manufacturer='Rockwell',
+            capacity=7,
+            weight=78000,
+            launch_date=date(1985, 10, 3),
+        )
+
+        gemini = self.create_mission('Gemini', commander=self.zed, spacecraft=shuttle)
+        gemini.astronauts.add(self.zed, self.amy)
+        apollo = self.create_mission('Apollo', commander=self.amy)
+        apollo.astronauts.add(self.amy)
+
+        shuttle.delete()
+
+        self.assertCounters(self.zed, 0, 0)
+        self.assertCounters(self.amy, 1, 1)
+
+    def test_rebuild_command_repairs_counters(self):
+        gemini = self.create_mission('Gemini', commander=self.zed)
+        gemini.astronauts.add(self.zed, self.amy)
+
+        # QuerySet.update() sends no signals
+        Astronaut.objects.update(missions_count=5, commanded_count=5)
+        Mission.objects.filter(pk=gemini.pk).update(commander=self.bob)
+
+        stdout = StringIO()
+        call_command('rebuild_astronaut_counters', stdout=stdout)
+
+        self.assertIn('Rebuilt mission counters for 3 astronauts.', stdout.getvalue())
+        self.assertCounters(self.zed, 1, 0)
+        self.assertCounters(self.amy, 1, 0)
+        self.assertCounters(self.bob, 0, 1)
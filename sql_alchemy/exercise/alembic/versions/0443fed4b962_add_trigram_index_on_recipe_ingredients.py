@@ -0,0 +1,33 @@
+"""add trigram index on recipe ingredients
+
+Revision ID: 0443fed4b962
+Revises: da5b138d3eb8
+Create Date: 2026-10-18 14:08:52.604417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0443fed4b962'
+down_revision: Union[str, None] = 'da5b138d3eb8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_recipes_ingredients_trgm',
+        'recipes',
+        ['ingredients'],
+        postgresql_using='gin',
+        postgresql_ops={'ingredients': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_recipes_ingredients_trgm', table_name='recipes')
@@ -0,0 +1,46 @@
+"""add name and chef indexes
+
+Revision ID: eea9ec0faced
+Revises: 0443fed4b962
+Create Date: 2026-10-18 16:41:07.352918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'eea9ec0faced'
+down_revision: Union[str, None] = '0443fed4b962'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_recipes_name', 'recipes', ['name'], True),
+    ('ix_recipes_chief_id', 'recipes', ['chief_id'], False),
+    ('ix_chefs_name', 'chefs', ['name'], False),
+]
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(sa.text(
+        'SELECT name FROM recipes GROUP BY name HAVING count(*) > 1 ORDER BY name LIMIT 10'
+    )).scalars().all()
+
+    if duplicates:
+        raise Exception(f"Recipe names must be unique before indexing, duplicates: {', '.join(duplicates)}")
+
+    # CONCURRENTLY cannot run inside a transaction block. A failed build leaves
+    # an invalid index behind, so any leftover is dropped before retrying
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns, unique in INDEXES:
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+            op.create_index(index_name, table_name, columns, unique=unique, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns, unique in reversed(INDEXES):
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
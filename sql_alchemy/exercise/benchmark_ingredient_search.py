@@ -0,0 +1,72 @@
+import argparse
+import statistics
+import time
+
+from sqlalchemy import text
+
+from caller import engine, get_recipes_by_ingredient
+
+INGREDIENTS = [
+    'flour', 'sugar', 'butter', 'eggs', 'milk', 'salt', 'pepper', 'garlic', 'onion', 'tomato',
+    'basil', 'olive oil', 'rice', 'chicken', 'beef', 'carrot', 'potato', 'lemon', 'honey', 'cheese',
+]
+
+SEED_RECIPES = text("""
+    INSERT INTO recipes (name, ingredients, instructions)
+    SELECT
+        'Synthetic recipe ' || n || '-' || txid_current(),
+        (
+            SELECT string_agg(word, ', ')
+            FROM (
+                SELECT (:ingredients)[1 + floor(random() * cardinality(:ingredients))::int] AS word
+                FROM generate_series(1, 6)
+                WHERE n > 0
+                UNION ALL
+                SELECT 'spice-' || substr(md5(n::text), 1, 8)
+            ) AS words
+        ),
+        'Mix everything and cook.'
+    FROM generate_series(1, :count) AS n
+""")
+
+
+def seed(count):
+    with engine.begin() as connection:
+        connection.execute(SEED_RECIPES, {'ingredients': INGREDIENTS, 'count': count})
+        connection.execute(text('ANALYZE recipes'))
+
+
+def time_search(ingredient, runs, use_index):
+    timings = []
+
+    for _ in range(runs):
+        with engine.begin() as connection:
+            if not use_index:
+                connection.execute(text('SET LOCAL enable_bitmapscan = off'))
+                connection.execute(text('SET LOCAL enable_indexscan = off'))
+
+            started = time.perf_counter()
+            connection.execute(
+                text("SELECT id FROM recipes WHERE ingredients ILIKE :pattern"),
+                {'pattern': f'%{ingredient}%'},
+            ).all()
+            timings.append(time.perf_counter() - started)
+
+    return statistics.median(timings) * 1000
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seed', type=int, default=0, help='number of synthetic recipes to insert first')
+    parser.add_argument('--ingredient', default='spice-00ab')
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    if args.seed:
+        seed(args.seed)
+
+    sequential = time_search(args.ingredient, args.runs, use_index=False)
+    indexed = time_search(args.ingredient, args.runs, use_index=True)
+
+    print(f"sequential scan: {sequential:.1f} ms, trigram index: {indexed:.1f} ms (median of {args.runs})")
+    print(f"get_recipes_by_ingredient returned {len(get_recipes_by_ingredient(args.ingredient))} recipes")
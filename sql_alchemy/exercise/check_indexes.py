@@ -0,0 +1,43 @@
+import sys
+
+from sqlalchemy import text, bindparam
+
+from caller import engine
+
+# Columns that caller.py filters or joins on
+FILTERED_COLUMNS = [
+    ('recipes', 'name'),
+    ('recipes', 'ingredients'),
+    ('recipes', 'chief_id'),
+    ('chefs', 'name'),
+]
+
+# Only valid indexes count, a failed CREATE INDEX CONCURRENTLY leaves an invalid one
+LEADING_INDEX_COLUMNS = text("""
+    SELECT index_class.relname AS index_name, table_class.relname AS table_name, attribute.attname AS column_name
+    FROM pg_index AS pg_index
+    JOIN pg_class AS index_class ON index_class.oid = pg_index.indexrelid
+    JOIN pg_class AS table_class ON table_class.oid = pg_index.indrelid
+    JOIN pg_attribute AS attribute
+        ON attribute.attrelid = pg_index.indrelid AND attribute.attnum = pg_index.indkey[0]
+    WHERE pg_index.indisvalid AND table_class.relname IN :tables
+""").bindparams(bindparam('tables', sorted({table for table, _ in FILTERED_COLUMNS}), expanding=True))
+
+
+def find_unindexed_columns(connection):
+    indexed = {(row.table_name, row.column_name) for row in connection.execute(LEADING_INDEX_COLUMNS)}
+
+    return [column for column in FILTERED_COLUMNS if column not in indexed]
+
+
+if __name__ == '__main__':
+    with engine.connect() as connection:
+        missing = find_unindexed_columns(connection)
+
+    for table_name, column_name in missing:
+        print(f"Missing index on {table_name}.{column_name}")
+
+    if missing:
+        sys.exit(1)
+
+    print(f"All {len(FILTERED_COLUMNS)} filtered columns are indexed")
@@ -1,19 +1,68 @@
-def session_decorator(session):
+from contextvars import ContextVar
+from functools import wraps
+
+from sqlalchemy.exc import DBAPIError
+
+# serialization_failure and deadlock_detected
+RETRYABLE_PGCODES = {'40001', '40P01'}
+
+_ambient_session = ContextVar('ambient_session', default=None)
+
+
+class AmbientSession:
+    def __getattr__(self, name):
+        current_session = _ambient_session.get()
+
+        if current_session is None:
+            raise RuntimeError("No open session, call this from a function wrapped with session_decorator")
+
+        return getattr(current_session, name)
+
+
+def is_retryable(error):
+    return getattr(error.orig, 'pgcode', None) in RETRYABLE_PGCODES
+
+
+def session_decorator(session_factory, retries=0):
     def decorator(func):
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            try:
-                result = func(*args, **kwargs)
-                session.commit()
+            # Nested calls join the session of the outermost call
+            if _ambient_session.get() is not None:
+                return func(*args, **kwargs)
+
+            for attempt in range(retries + 1):
+                session = session_factory()
+                token = _ambient_session.set(session)
+
+                try:
+                    result = func(*args, **kwargs)
+                    session.commit()
 
-                return result
+                    return result
 
-            except Exception as e:
-                session.rollback()
-                raise e
+                except DBAPIError as e:
+                    session.rollback()
 
-            finally:
-                session.close()
+                    if attempt == retries or not is_retryable(e):
+                        raise e
+
+                except Exception as e:
+                    session.rollback()
+                    raise e
+
+                finally:
+                    _ambient_session.reset(token)
+                    session.close()
 
         return wrapper
 
     return decorator
+
+
+def escape_like(value, escape_char='/'):
+    return (
+        value.replace(escape_char, escape_char * 2)
+        .replace('%', f'{escape_char}%')
+        .replace('_', f'{escape_char}_')
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -8,6 +8,15 @@ Base = declarative_base()
 class Recipe(Base):
     __tablename__ = 'recipes'
 
+    __table_args__ = (
+        Index(
+            'ix_recipes_ingredients_trgm',
+            'ingredients',
+            postgresql_using='gin',
+            postgresql_ops={'ingredients': 'gin_trgm_ops'},
+        ),
+    )
+
     id = Column(
         Integer,
         primary_key=True,
@@ -16,7 +25,9 @@ class Recipe(Base):
 
     name = Column(
         String(100),
-        nullable=False
+        nullable=False,
+        unique=True,
+        index=True
     )
 
     ingredients = Column(
@@ -31,7 +42,8 @@ class Recipe(Base):
 
     chief_id = Column(
         Integer,
-        ForeignKey('chefs.id')
+        ForeignKey('chefs.id'),
+        index=True
     )
 
     chef = relationship("Chef", back_populates="recipes")
@@ -48,7 +60,8 @@ class Chef(Base):
 
     name = Column(
         String(100),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     recipes = relationship("Recipe", back_populates="chef")
@@ -0,0 +1,117 @@
+import json
+import logging
+import re
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+logger = logging.getLogger('sqlalchemy.instrumentation')
+
+SLOW_QUERY_MS = 100
+N_PLUS_ONE_THRESHOLD = 5
+
+FINGERPRINT_PATTERNS = (
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    (re.compile(r'%\(\w+\)s|:\w+|\$\d+|%s'), '?'),
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)'), '(...)'),
+    (re.compile(r'\s+'), ' '),
+)
+
+_current_log = ContextVar('query_log', default=None)
+
+
+def fingerprint(statement):
+    for pattern, replacement in FINGERPRINT_PATTERNS:
+        statement = pattern.sub(replacement, statement)
+
+    return statement.strip()
+
+
+class QueryLog:
+    def __init__(self, label=None):
+        self.label = label
+        self.queries = []
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def total_ms(self):
+        return sum(query['duration_ms'] for query in self.queries)
+
+    def add(self, statement, duration_ms, rowcount):
+        self.queries.append({
+            'statement': statement,
+            'fingerprint': fingerprint(statement),
+            'duration_ms': round(duration_ms, 3),
+            'rowcount': rowcount,
+        })
+
+    def repeated(self, threshold=N_PLUS_ONE_THRESHOLD):
+        groups = defaultdict(list)
+
+        for query in self.queries:
+            groups[query['fingerprint']].append(query['duration_ms'])
+
+        return [
+            {'fingerprint': key, 'count': len(durations), 'total_ms': round(sum(durations), 3)}
+            for key, durations in groups.items()
+            if len(durations) >= threshold
+        ]
+
+    def as_dict(self, threshold=N_PLUS_ONE_THRESHOLD):
+        return {
+            'label': self.label,
+            'count': self.count,
+            'total_ms': round(self.total_ms, 3),
+            'repeated': self.repeated(threshold),
+            'queries': self.queries,
+        }
+
+    def to_json(self, threshold=N_PLUS_ONE_THRESHOLD, **kwargs):
+        return json.dumps(self.as_dict(threshold), **kwargs)
+
+
+class QueryInstrumentation:
+    def __init__(self, *engines, slow_query_ms=SLOW_QUERY_MS, n_plus_one_threshold=N_PLUS_ONE_THRESHOLD):
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+        for engine in engines:
+            event.listen(engine, 'before_cursor_execute', self.before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', self.after_cursor_execute)
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info['query_started'] = time.perf_counter()
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration_ms = (time.perf_counter() - conn.info['query_started']) * 1000
+
+        if duration_ms >= self.slow_query_ms:
+            logger.warning("Slow query (%.1f ms): %s", duration_ms, statement)
+
+        query_log = _current_log.get()
+
+        if query_log is not None:
+            query_log.add(statement, duration_ms, cursor.rowcount)
+
+    @contextmanager
+    def capture(self, label=None):
+        query_log = QueryLog(label)
+        token = _current_log.set(query_log)
+
+        try:
+            yield query_log
+        finally:
+            _current_log.reset(token)
+
+        for pattern in query_log.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "Possible N+1 in %s: %d queries (%.1f ms) for %s",
+                label, pattern['count'], pattern['total_ms'], pattern['fingerprint'],
+            )
@@ -0,0 +1,169 @@
+# Runs against the local database from caller.py, migrated with `alembic upgrade head`
+#
+#   python -m unittest test_caller
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import OperationalError
+
+import caller
+from models import Recipe
+
+THREADS = 16
+
+
+def setUpModule():
+    try:
+        with caller.engine.connect():
+            pass
+    except OperationalError as e:
+        raise unittest.SkipTest(f"The local database is not available: {e.orig}")
+
+
+class CallerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.prefix = f'test-{uuid4().hex[:8]}-'
+
+    def tearDown(self):
+        with caller.Session() as session:
+            session.execute(delete(Recipe).where(Recipe.name.startswith(self.prefix)))
+            session.commit()
+
+    def recipe_rows(self):
+        with caller.Session() as session:
+            return dict(session.execute(
+                select(Recipe.name, Recipe.ingredients)
+                .where(Recipe.name.startswith(self.prefix))
+            ).all())
+
+    def run_in_threads(self, task, count):
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            # list() re-raises the first exception from any thread
+            return list(executor.map(task, range(count)))
+
+
+class ConcurrentRecipeWritesTest(CallerTestCase):
+    RECIPES_PER_THREAD = 20
+
+    def test_create_and_update_from_many_threads(self):
+        def create_and_update(thread):
+            renamed = 0
+
+            for number in range(self.RECIPES_PER_THREAD):
+                name = f'{self.prefix}{thread}-{number}'
+
+                caller.create_recipe(name, f'ingredients {number}', 'instructions')
+                renamed += caller.update_recipe_by_name(
+                    name, f'{name}-renamed', f'updated {thread}', 'updated instructions',
+                )
+
+            return renamed
+
+        renamed = self.run_in_threads(create_and_update, THREADS)
+
+        self.assertEqual(renamed, [self.RECIPES_PER_THREAD] * THREADS)
+
+        rows = self.recipe_rows()
+
+        self.assertEqual(len(rows), THREADS * self.RECIPES_PER_THREAD)
+
+        for name, ingredients in rows.items():
+            thread = name[len(self.prefix):].split('-')[0]
+
+            self.assertTrue(name.endswith('-renamed'))
+            self.assertEqual(ingredients, f'updated {thread}')
+
+        # Every call closed its session, so no connection is left checked out
+        self.assertEqual(caller.engine.pool.checkedout(), 0)
+
+    def test_updates_of_one_recipe_from_many_threads(self):
+        name = f'{self.prefix}shared'
+        caller.create_recipe(name, 'ingredients', 'instructions')
+
+        changed = self.run_in_threads(
+            lambda thread: caller.update_recipe_by_name(name, name, f'updated {thread}', 'instructions'),
+            THREADS * 4,
+        )
+
+        self.assertEqual(changed, [1] * THREADS * 4)
+        self.assertIn(self.recipe_rows()[name], {f'updated {thread}' for thread in range(THREADS * 4)})
+
+
+class SwapIngredientsTest(CallerTestCase):
+    SWAPS_PER_THREAD = 10
+
+    def setUp(self):
+        super().setUp()
+        self.names = [f'{self.prefix}{letter}' for letter in 'abcd']
+
+        for name in self.names:
+            caller.create_recipe(name, f'ingredients of {name}', 'instructions')
+
+        self.original = self.recipe_rows()
+
+    def test_opposing_swaps_do_not_deadlock(self):
+        first, second, third, fourth = self.names
+        orders = [[(first, second), (third, fourth)], [(fourth, third), (second, first)]]
+
+        def swap(thread):
+            # Straight through the statement, the decorator would retry a deadlock away
+            statement = caller.build_swap_statement(orders[thread % 2])
+
+            for _ in range(self.SWAPS_PER_THREAD):
+                with caller.Session() as session:
+                    self.assertEqual(session.execute(statement).rowcount, 4)
+                    session.commit()
+
+        self.run_in_threads(swap, THREADS)
+
+        # Every pair was swapped an even number of times
+        self.assertEqual(self.recipe_rows(), self.original)
+
+    def test_opposing_swaps_by_name(self):
+        first, second = self.names[:2]
+
+        def swap(thread):
+            for _ in range(self.SWAPS_PER_THREAD):
+                if thread % 2:
+                    caller.swap_recipe_ingredients_by_name(first, second)
+                else:
+                    caller.swap_recipe_ingredients_by_name(second, first)
+
+        self.run_in_threads(swap, THREADS)
+
+        self.assertEqual(self.recipe_rows(), self.original)
+
+    def test_bulk_swap(self):
+        first, second, third, fourth = self.names
+
+        self.assertEqual(caller.swap_recipe_ingredients_in_bulk([(first, second), (fourth, third)]), 4)
+
+        rows = self.recipe_rows()
+
+        self.assertEqual(rows[first], self.original[second])
+        self.assertEqual(rows[second], self.original[first])
+        self.assertEqual(rows[third], self.original[fourth])
+        self.assertEqual(rows[fourth], self.original[third])
+
+    def test_missing_recipe_rolls_back_the_whole_bulk_swap(self):
+        first, second, third = self.names[:3]
+
+        with self.assertRaisesRegex(Exception, 'do not exist'):
+            caller.swap_recipe_ingredients_in_bulk([(first, second), (third, f'{self.prefix}missing')])
+
+        self.assertEqual(self.recipe_rows(), self.original)
+
+    def test_recipe_in_two_pairs_is_rejected(self):
+        first, second, third = self.names[:3]
+
+        with self.assertRaisesRegex(Exception, 'only one swap'):
+            caller.swap_recipe_ingredients_in_bulk([(first, second), (second, third)])
+
+        self.assertEqual(self.recipe_rows(), self.original)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import argparse
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import text
+
+from main import engine, pool_metrics
+
+
+def checkout(query_seconds):
+    started = time.perf_counter()
+
+    with engine.connect() as connection:
+        checkout_latency = time.perf_counter() - started
+        connection.execute(text('SELECT pg_sleep(:seconds)'), {'seconds': query_seconds})
+
+    return checkout_latency
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, default=60)
+    parser.add_argument('--checkouts', type=int, default=2000)
+    parser.add_argument('--query-seconds', type=float, default=0.01)
+    args = parser.parse_args()
+
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        latencies = sorted(executor.map(checkout, [args.query_seconds] * args.checkouts))
+
+    print(f"checkout latency p50: {statistics.median(latencies) * 1000:.2f} ms, "
+          f"p99: {latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f} ms, "
+          f"max: {latencies[-1] * 1000:.2f} ms")
+    print(json.dumps(pool_metrics.stats(), indent=2))
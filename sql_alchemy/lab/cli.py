@@ -0,0 +1,45 @@
+import argparse
+import json
+
+from main import engine, pool_metrics, query_instrumentation, Session
+from models import Base
+from queries import list_orders, order_report_rows
+
+
+def create_schema():
+    Base.metadata.create_all(engine)
+    print('Schema created.')
+
+
+def drop_schema():
+    Base.metadata.drop_all(engine)
+    print('Schema dropped.')
+
+
+def show_pool_stats():
+    print(json.dumps(pool_metrics.stats(), indent=2))
+
+
+def show_query_report():
+    with query_instrumentation.capture('query-report') as query_log:
+        with Session() as session:
+            list_orders(session)
+            order_report_rows(session)
+
+    print(query_log.to_json(query_instrumentation.n_plus_one_threshold, indent=2))
+
+
+COMMANDS = {
+    'create-schema': create_schema,
+    'drop-schema': drop_schema,
+    'pool-stats': show_pool_stats,
+    'query-report': show_query_report,
+}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('command', choices=COMMANDS)
+    args = parser.parse_args()
+
+    COMMANDS[args.command]()
@@ -1,6 +1,5 @@
 from sqlalchemy import Column, Integer, String, Boolean, ForeignKey
 from sqlalchemy.orm import declarative_base, relationship
-from main import engine
 
 Base = declarative_base()
 
@@ -21,5 +20,3 @@ class Order(Base):
     user_id = Column(Integer, ForeignKey('users.id'))
     user = relationship('User')
 
-
-Base.metadata.create_all(engine)
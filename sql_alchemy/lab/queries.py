@@ -0,0 +1,40 @@
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, contains_eager
+
+from models import User, Order
+
+
+def list_orders(session):
+    return session.scalars(
+        select(Order)
+        .options(joinedload(Order.user))
+        .order_by(Order.user_id.desc())
+    ).all()
+
+
+def list_user_orders(session, username):
+    return session.scalars(
+        select(Order)
+        .join(Order.user)
+        .options(contains_eager(Order.user))
+        .where(User.username == username)
+        .order_by(Order.id)
+    ).all()
+
+
+def order_report_rows(session):
+    return session.execute(
+        select(Order.id, Order.is_completed, User.username)
+        .outerjoin(Order.user)
+        .order_by(Order.user_id.desc())
+    ).all()
+
+
+def iter_orders(session, batch_size=1000):
+    yield from session.scalars(
+        select(Order)
+        .outerjoin(Order.user)
+        .options(contains_eager(Order.user))
+        .order_by(Order.user_id.desc())
+        .execution_options(yield_per=batch_size)
+    )
@@ -1,5 +1,6 @@
 from main import Session
 from models import User, Order
+from queries import list_orders
 
 # with Session() as session:
 #
@@ -56,7 +57,7 @@ from models import User, Order
 
 
 # with Session() as session:
-#     orders = session.query(Order).order_by(Order.user_id.desc()).all()
+#     orders = list_orders(session)
 #     if not orders:
 #         print('No orders yet.')
 #     else:
@@ -0,0 +1,62 @@
+import unittest
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, User, Order
+from queries import list_orders, list_user_orders
+
+
+class OrderQueriesTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        self.Session = sessionmaker(bind=self.engine)
+        self.statements = []
+
+        event.listen(self.engine, 'before_cursor_execute', self.count_statement)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def count_statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def add_orders(self, count):
+        Base.metadata.drop_all(self.engine)
+        Base.metadata.create_all(self.engine)
+
+        with self.Session() as session:
+            users = [User(username=f'user{number}', email=f'user{number}@example.com') for number in range(count)]
+            session.add_all(users)
+            session.add_all(Order(user=user) for user in users)
+            session.add(Order())
+            session.commit()
+
+        self.statements.clear()
+
+    def test_list_orders_uses_one_query(self):
+        for count in (1, 10, 200):
+            with self.subTest(count=count):
+                self.add_orders(count)
+
+                with self.Session() as session:
+                    orders = list_orders(session)
+                    usernames = [order.user.username for order in orders if order.user]
+
+                self.assertEqual(len(orders), count + 1)
+                self.assertEqual(len(usernames), count)
+                self.assertEqual(len(self.statements), 1)
+
+    def test_list_user_orders_uses_one_query(self):
+        self.add_orders(20)
+
+        with self.Session() as session:
+            orders = list_user_orders(session, 'user3')
+            emails = {order.user.email for order in orders}
+
+        self.assertEqual(emails, {'user3@example.com'})
+        self.assertEqual(len(self.statements), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# Load test scenarios for fruitipediaApp, run against a seeded PostgreSQL database.
+#
+#   python manage.py migrate && python manage.py seed_fruits --fruits 5000
+#   gunicorn fruitipediaApp.wsgi --threads 8 --bind 127.0.0.1:8000
+#   locust -f benchmarks/locustfile.py --host http://127.0.0.1:8000 --headless \
+#       --users 50 --spawn-rate 10 --run-time 2m --report-json benchmarks/report.json \
+#       --baseline-json benchmarks/baseline.json
+
+import json
+import random
+import re
+import string
+import sys
+from pathlib import Path
+
+from locust import HttpUser, task, between, events
+
+# The JSON report is shared with the musicApp load tests
+sys.path.append(str(Path(__file__).resolve().parents[3] / 'benchmarks'))
+
+import locust_report  # noqa: F401 registers the JSON report options
+
+CSRF_TOKEN_PATTERN = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+manifest = {}
+
+
+@events.init_command_line_parser.add_listener
+def add_arguments(parser):
+    parser.add_argument('--seed-manifest', default='benchmarks/seed-manifest.json')
+
+
+@events.test_start.add_listener
+def load_manifest(environment, **kwargs):
+    with open(environment.parsed_options.seed_manifest) as manifest_file:
+        manifest.update(json.load(manifest_file))
+
+
+class FruitipediaUser(HttpUser):
+    wait_time = between(0.5, 2)
+
+    @task(1)
+    def index(self):
+        self.client.get('/', name='/')
+
+    @task(4)
+    def dashboard(self):
+        self.client.get('/dashboard/', name='/dashboard/')
+
+    @task(4)
+    def fruit_details(self):
+        self.client.get(f"/{random.choice(manifest['fruits'])}/details-fruit/", name='/[pk]/details-fruit/')
+
+    @task(2)
+    def edit_form(self):
+        self.client.get(f"/{random.choice(manifest['fruits'])}/edit-fruit/", name='/[pk]/edit-fruit/')
+
+    @task(1)
+    def create_fruit(self):
+        page = self.client.get('/create-fruit/', name='/create-fruit/')
+        match = CSRF_TOKEN_PATTERN.search(page.text)
+
+        if not match:
+            return
+
+        with self.client.post(
+            '/create-fruit/',
+            data={
+                'csrfmiddlewaretoken': match.group(1),
+                'name': 'Load' + ''.join(random.choices(string.ascii_lowercase, k=12)),
+                'image_url': 'https://example.com/fruits/load.png',
+                'description': 'Created by the load test',
+                'nutrition': str(random.randint(10, 500)),
+                'category': random.choice(manifest['categories']),
+            },
+            allow_redirects=False,
+            name='/create-fruit/ submit',
+            catch_response=True,
+        ) as response:
+            if response.status_code == 302:
+                response.success()
+            else:
+                response.failure(f"Fruit rejected with {response.status_code}")
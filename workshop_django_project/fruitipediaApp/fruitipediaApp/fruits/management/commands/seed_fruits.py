@@ -0,0 +1,73 @@
+import json
+import random
+import string
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from fruitipediaApp.fruits.models import Category, Fruit
+
+NAME_LETTERS = 5
+
+
+def letters_name(prefix, number):
+    # Fruit names may only contain letters, so the number is spelled in base 26
+    letters = []
+
+    for _ in range(NAME_LETTERS):
+        number, remainder = divmod(number, len(string.ascii_lowercase))
+        letters.append(string.ascii_lowercase[remainder])
+
+    return prefix + ''.join(reversed(letters))
+
+
+class Command(BaseCommand):
+    help = ('Fills an empty database with a reproducible set of categories and fruits '
+            'and writes a manifest of their ids for the load tests.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--categories', type=int, default=20)
+        parser.add_argument('--fruits', type=int, default=5000)
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--manifest', default='benchmarks/seed-manifest.json')
+
+    def handle(self, *args, **options):
+        if Fruit.objects.exists() or Category.objects.exists():
+            raise CommandError("The database is not empty, seed a fresh database so runs stay comparable")
+
+        generator = random.Random(options['seed'])
+
+        with transaction.atomic():
+            categories = Category.objects.bulk_create(
+                Category(name=f'Category {number:03d}')
+                for number in range(options['categories'])
+            )
+
+            fruits = Fruit.objects.bulk_create(
+                (
+                    Fruit(
+                        name=letters_name('Fruit', number),
+                        image_url=f'https://example.com/fruits/{number}.png',
+                        description=' '.join(generator.choices(string.ascii_lowercase, k=40)),
+                        nutrition=str(generator.randint(10, 500)),
+                        category=generator.choice(categories),
+                    )
+                    for number in range(options['fruits'])
+                ),
+                batch_size=options['batch_size'],
+            )
+
+        manifest = {
+            'seed': options['seed'],
+            'categories': [category.pk for category in categories],
+            'fruits': [fruit.pk for fruit in fruits],
+        }
+
+        with open(options['manifest'], 'w') as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(categories)} categories and {len(fruits)} fruits, "
+            f"manifest written to {options['manifest']}."
+        ))